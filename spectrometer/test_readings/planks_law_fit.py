@@ -6,28 +6,41 @@ from scipy.optimize import curve_fit
 h = 6.626e-34  # Planck constant [J·s]
 c = 299792458  # Speed of light [m/s]
 k = 1.381e-23  # Boltzmann constant [J/K]
+hc_k = (h * c) / k  # hc/k [m·K]
+two_hc2 = 2 * h * c**2  # 2hc² [W·m²]
 
 # Planck's law function (with overflow protection)
 def planck_law(l, T, a):
-    exponent = np.clip((h * c) / (l * k * T), 1e-10, 700)
-    B = (2 * h * c**2) / (l**5 * np.expm1(exponent))
+    exponent = np.clip(hc_k / (l * T), 1e-10, 700)
+    B = two_hc2 / (l**5 * np.expm1(exponent))
     return a * B
 
+# Analytic Jacobian of planck_law w.r.t. (T, a), saves curve_fit the finite differences
+def planck_jac(l, T, a):
+    exponent = np.clip(hc_k / (l * T), 1e-10, 700)
+    em1 = np.expm1(exponent)
+    B = two_hc2 / (l**5 * em1)
+    dB_dT = B * exponent * (em1 + 1) / (em1 * T)
+    return np.column_stack((a * dB_dT, B))
+
 # Load data
 data = np.loadtxt('data.txt', delimiter=',')
 independent_variable = data[:, 0] * 1e-9  # Convert nm → meters
 measured_quantity = data[:, 1]
 
 # Keep data in 500–950 nm range (adjust as needed)
-mask = (independent_variable >= 500e-9) & (independent_variable <= 950e-9)
-wavelengths_trimmed = independent_variable[mask]
-intensities_trimmed = measured_quantity[mask]
-
-# Normalize intensity
-measured_quantity /= np.max(measured_quantity)
+# wavelengths are sorted, so the range is a contiguous slice
+trim = slice(np.searchsorted(independent_variable, 500e-9),
+             np.searchsorted(independent_variable, 950e-9, side='right'))
+wavelengths_trimmed = independent_variable[trim]
+intensities_trimmed = measured_quantity[trim].copy()  # normalized separately below
+
+# Normalize intensity (one argmax pass gives both the peak value and its wavelength)
+peak_idx = np.argmax(measured_quantity)
+measured_quantity /= measured_quantity[peak_idx]
 intensities_trimmed /= np.max(intensities_trimmed)
 
-lambda_peak = independent_variable[np.argmax(measured_quantity)]
+lambda_peak = independent_variable[peak_idx]
 T_wien = (2.898e-3) / lambda_peak  # λ in meters
 print(f"Wien-estimated Temperature: {T_wien:.2f} K")
 
@@ -35,10 +48,10 @@ print(f"Wien-estimated Temperature: {T_wien:.2f} K")
 initial_guess = [T_wien, 1.0]
 
 # Fit
-parameters, covariance = curve_fit(planck_law, independent_variable, measured_quantity, p0=initial_guess)
+parameters, covariance = curve_fit(planck_law, independent_variable, measured_quantity, p0=initial_guess, jac=planck_jac)
 errors = np.sqrt(np.diag(covariance))
 
-trim_para , trim_cov = curve_fit(planck_law, wavelengths_trimmed, intensities_trimmed, p0=initial_guess)
+trim_para , trim_cov = curve_fit(planck_law, wavelengths_trimmed, intensities_trimmed, p0=initial_guess, jac=planck_jac)
 trim_errors = np.sqrt(np.diag(trim_cov))
 
 # Goodness of fit: reduced chi-squared